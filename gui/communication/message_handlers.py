@@ -17,7 +17,8 @@ class MessageHandlers:
             'rider/status': self.handle_status_message,
             'rider/status/battery': self.handle_battery_message,
             'rider/status/imu': self.handle_imu_message,
-            'rider/response/image_capture': self.handle_image_capture_response
+            'rider/response/image_capture': self.handle_image_capture_response,
+            'rider/camera/frame': self.handle_camera_frame
         }
     
     def debug_print(self, message: str):
@@ -49,9 +50,21 @@ class MessageHandlers:
         self.robot_state.update_imu(data)
     
     def handle_image_capture_response(self, data: Dict[str, Any]):
-        """Handle image capture response messages"""
+        """Handle image capture response messages (JSON; errors and legacy b64 frames)"""
         self.debug_print(f"[HANDLER] Processing image capture response: {data}")
         if self.image_capture_callback:
             self.image_capture_callback(data)
+        else:
+            self.debug_print("[HANDLER] No image capture callback set")
+
+    def handle_camera_frame(self, payload: bytes):
+        """Handle a raw JPEG frame; wrap it in the response shape the GUI expects"""
+        self.debug_print(f"[HANDLER] Processing camera frame: {len(payload)} bytes")
+        if self.image_capture_callback:
+            self.image_capture_callback({
+                'success': True,
+                'image_data': payload,
+                'image_size': len(payload)
+            })
         else:
             self.debug_print("[HANDLER] No image capture callback set") 
\ No newline at end of file
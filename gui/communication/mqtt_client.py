@@ -30,9 +30,14 @@ class MQTTClient:
             'control_system': 'rider/control/system',
             'control_image_capture': 'rider/control/image_capture',
             'response_image_capture': 'rider/response/image_capture',
+            'camera_frame': 'rider/camera/frame',
             'client_disconnect': 'rider/client/disconnect'
         }
 
+        # Topics whose payload is raw bytes, not JSON -- delivered to the
+        # callback as-is so large frames skip the decode()/json.loads pass
+        self._binary_topics = {self.topics['camera_frame']}
+
         # Callbacks for different message types
         self._message_callbacks: Dict[str, Callable] = {}
         self._connection_callbacks: Dict[str, Callable] = {}
@@ -305,13 +310,19 @@ class MQTTClient:
         """Handle incoming MQTT messages"""
         try:
             topic = msg.topic
-            payload_str = msg.payload.decode()
-            payload = json.loads(payload_str)
+            if topic in self._binary_topics:
+                payload = msg.payload
+                if self.debug_mode:
+                    print(f"[RECV] {datetime.now().strftime('%H:%M:%S.%f')[:-3]} | Topic: {topic}")
+                    print(f"       Payload: <{len(payload)} raw bytes>")
+            else:
+                payload_str = msg.payload.decode()
+                payload = json.loads(payload_str)
 
-            # Debug: Show incoming message traffic
-            if self.debug_mode:
-                print(f"[RECV] {datetime.now().strftime('%H:%M:%S.%f')[:-3]} | Topic: {topic}")
-                print(f"       Payload: {payload_str}")
+                # Debug: Show incoming message traffic
+                if self.debug_mode:
+                    print(f"[RECV] {datetime.now().strftime('%H:%M:%S.%f')[:-3]} | Topic: {topic}")
+                    print(f"       Payload: {payload_str}")
 
             # Route message to appropriate callback
             if topic in self._message_callbacks:
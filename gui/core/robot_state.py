@@ -2,6 +2,7 @@
 # coding=utf-8
 
 from datetime import datetime, timedelta
+from functools import partial
 from typing import Dict, Any, Callable, List
 
 class RobotState:
@@ -25,6 +26,12 @@ class RobotState:
             'last_update': None
         }
         
+        # Consistent (cpu_percent, cpu_temp, power_w) snapshot. Rebuilt as a
+        # fresh tuple whenever a CPU field changes; readers grab the whole
+        # attribute in one GIL-atomic load, so they can never see a torn mix
+        # of old and new fields while the MQTT thread is writing.
+        self._cpu_snapshot = (0.0, 0.0, 0.0)
+
         # Controller timeout tracking
         self.controller_timeout_seconds = 5.0  # Consider controller disconnected after 5 seconds
         self.last_controller_update = None
@@ -36,32 +43,58 @@ class RobotState:
             'status': [],
             'all': []
         }
+        # Pre-bound fast path for the hottest topic (see _rebuild_imu_fast_path)
+        self._imu_fast_cb = None
     
     def add_observer(self, event_type: str, callback: Callable):
         """Add observer for specific state changes"""
         if event_type in self._observers:
             self._observers[event_type].append(callback)
+            self._rebuild_imu_fast_path()
     
     def remove_observer(self, event_type: str, callback: Callable):
         """Remove observer for specific state changes"""
         if event_type in self._observers and callback in self._observers[event_type]:
             self._observers[event_type].remove(callback)
+            self._rebuild_imu_fast_path()
+
+    def _rebuild_imu_fast_path(self):
+        """Cache a pre-bound callable when IMU events have a single recipient.
+
+        IMU is the highest-rate topic; in the common case (the GUI's one
+        bundle observer) update_imu can then dispatch with one attribute load
+        and a direct call instead of indexing and walking observer lists per
+        sample. Falls back to the generic path for any other configuration."""
+        imu_cbs, all_cbs = self._observers['imu'], self._observers['all']
+        if len(imu_cbs) == 1 and not all_cbs:
+            self._imu_fast_cb = imu_cbs[0]
+        elif len(all_cbs) == 1 and not imu_cbs:
+            self._imu_fast_cb = partial(all_cbs[0], 'imu')
+        else:
+            self._imu_fast_cb = None
     
     def _notify_observers(self, event_type: str, data: Dict[str, Any]):
         """Notify all observers of state change"""
-        # Notify specific event observers
-        for callback in self._observers.get(event_type, []):
-            try:
-                callback(data)
-            except Exception as e:
-                print(f"Error in observer callback: {e}")
-        
+        # The topic keys are fixed at construction, so index the dict
+        # directly -- .get(..., []) built a throwaway default list per
+        # publish. The empty-list check also skips the loop setup entirely
+        # for topics nobody listens to.
+        callbacks = self._observers[event_type]
+        if callbacks:
+            for callback in callbacks:
+                try:
+                    callback(data)
+                except Exception as e:
+                    print(f"Error in observer callback: {e}")
+
         # Notify global observers
-        for callback in self._observers.get('all', []):
-            try:
-                callback(event_type, data)
-            except Exception as e:
-                print(f"Error in global observer callback: {e}")
+        global_callbacks = self._observers['all']
+        if global_callbacks:
+            for callback in global_callbacks:
+                try:
+                    callback(event_type, data)
+                except Exception as e:
+                    print(f"Error in global observer callback: {e}")
     
     def update_battery(self, data: Dict[str, Any]):
         """Update battery status"""
@@ -94,11 +127,19 @@ class RobotState:
             abs(old_roll - self.data['roll']) > 0.1 or
             abs(old_pitch - self.data['pitch']) > 0.1 or
             abs(old_yaw - self.data['yaw']) > 0.1):
-            self._notify_observers('imu', {
+            payload = {
                 'roll': self.data['roll'],
                 'pitch': self.data['pitch'],
                 'yaw': self.data['yaw']
-            })
+            }
+            imu_cb = self._imu_fast_cb
+            if imu_cb is not None:
+                try:
+                    imu_cb(payload)
+                except Exception as e:
+                    print(f"Error in observer callback: {e}")
+            else:
+                self._notify_observers('imu', payload)
     
     def update_status(self, data: Dict[str, Any]):
         """Update general robot status including battery level from rider/status message"""
@@ -127,6 +168,10 @@ class RobotState:
             self.last_controller_update = datetime.now()
         
         if changed_fields:
+            if not changed_fields.keys().isdisjoint(('cpu_percent', 'cpu_temp', 'power_w')):
+                self._cpu_snapshot = (self.data['cpu_percent'],
+                                      self.data['cpu_temp'],
+                                      self.data['power_w'])
             self.data['last_update'] = datetime.now()
             self._notify_observers('status', changed_fields)
             
@@ -152,11 +197,16 @@ class RobotState:
     
     def get_cpu_data(self) -> Dict[str, float]:
         """Get current CPU data"""
+        cpu_percent, cpu_temp, power_w = self._cpu_snapshot
         return {
-            'cpu_percent': self.data['cpu_percent'],
-            'cpu_temp': self.data['cpu_temp'],
-            'power_w': self.data['power_w']
+            'cpu_percent': cpu_percent,
+            'cpu_temp': cpu_temp,
+            'power_w': power_w
         }
+
+    def snapshot_cpu_data(self) -> tuple:
+        """Get a consistent (cpu_percent, cpu_temp, power_w) snapshot"""
+        return self._cpu_snapshot
     
     def _check_controller_timeout(self):
         """Check if controller has timed out and update status if needed"""
@@ -1,12 +1,23 @@
 #!/usr/bin/env python3
 # coding=utf-8
 
-import time
+import logging
 import threading
+import tkinter as tk
+from functools import partial
 from typing import Dict, Callable, Any
 from .main_window import MainWindow
 from core.robot_state import RobotState
 
+# Status fields that feed the CPU widget; frozenset so the per-message
+# membership test is one C-level isdisjoint instead of a generator walk
+_CPU_FIELDS = frozenset(('cpu_percent', 'cpu_temp', 'power_w'))
+
+# Hot-path observer tracing goes through logging: with %s-style lazy
+# formatting a disabled logger costs one level check, where the old
+# debug-gated print still built the f-string on some paths
+log = logging.getLogger(__name__)
+
 class GUIManager:
     def __init__(self, broker_host: str, robot_state: RobotState, callbacks: Dict[str, Callable], debug: bool = False):
         self.broker_host = broker_host
@@ -14,132 +25,190 @@ class GUIManager:
         self.callbacks = callbacks
         self.debug_mode = debug
 
+        # Resolve hot-path callbacks once -- the periodic tick shouldn't pay
+        # a dict probe (plus a fresh default lambda) every 100ms
+        self._is_mqtt_connected = callbacks.get('is_mqtt_connected') or (lambda: False)
+
         # GUI components
         self.main_window = MainWindow(broker_host, callbacks, debug)
 
-        # GUI update thread
+        # Periodic-update state
         self.gui_running = True
-        self.gui_thread = None
+        self._tick_after_id = None
+
+        # Latest-wins payloads from the MQTT-thread observers, drained on the
+        # Tk thread at <=30 FPS -- a 100+ Hz IMU no longer queues one Tk job
+        # per sample, only the freshest value per flush window gets painted
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._flush_after_id = None
+        self._time_after_id = None
+
+        # Last (mqtt, controller) pair pushed to the status widgets
+        self._last_controller_status = (None, None)
+
+        # Last payload stashed per topic -- chatty producers that republish
+        # an identical payload get dropped before any Tk work is queued
+        self._last_payload = {'battery': None, 'imu': None, 'status': None}
 
         # Setup observers for robot state changes
         self._setup_observers()
 
-        # Setup GUI update thread
-        self._start_gui_thread()
+        # Periodic updates run on Tk's own event loop -- no polling thread
+        self._start_periodic_updates()
 
     def _setup_observers(self):
-        """Setup observers for robot state changes"""
-        self.robot_state.add_observer('battery', self._on_battery_update)
-        self.robot_state.add_observer('imu', self._on_imu_update)
-        self.robot_state.add_observer('status', self._on_status_update)
-
-    def _start_gui_thread(self):
-        """Start GUI update thread"""
-        self.gui_thread = threading.Thread(target=self._gui_update_loop, daemon=True)
-        self.gui_thread.start()
-        if self.debug_mode:
-            print("🧵 GUI update thread started (daemon)")
-
-    def _gui_update_loop(self):
-        """GUI update loop running in separate thread"""
-        if self.debug_mode:
-            print("🔄 GUI update loop started")
-
-        while self.gui_running:
-            try:
-                # Update time display
-                self.main_window.schedule_update(self.main_window.update_time)
-
-                # Update controller status
-                self._update_controller_status()
-
-                time.sleep(0.1)  # 10 FPS update rate
-            except Exception as e:
-                if self.gui_running:  # Only log if we're supposed to be running
-                    if self.debug_mode:
-                        print(f"⚠️ GUI update error: {e}")
-                break
-
-        if self.debug_mode:
-            print("🔄 GUI update loop stopped")
-
-    def _update_controller_status(self):
-        """Update controller connection status display"""
+        """Setup observers for robot state changes.
+
+        RobotState's 'all' topic hands every publish to one callback as
+        (event_type, data), so a single registration covers battery, IMU and
+        status -- each state mutation walks one observer list, not two."""
+        self.robot_state.add_observer('all', self._on_state_update)
+
+    def _on_state_update(self, event_type: str, data: Dict[str, Any]):
+        """Single dispatch point for robot-state publishes (MQTT thread)"""
+        if event_type == 'imu':
+            self._on_imu_update(data)
+        elif event_type == 'battery':
+            self._on_battery_update(data)
+        elif event_type == 'status':
+            self._on_status_update(data)
+
+    def _start_periodic_updates(self):
+        """Arm the periodic tick on the Tk event loop.
+
+        Replaces the old 10 Hz polling thread: after() re-arms itself at the
+        tail, so the updates run on the main thread with no thread wakeups
+        and no cross-thread marshaling for the clock and controller status."""
+        self._tick_after_id = self.main_window.root.after(100, self._periodic_tick)
+        self._flush_after_id = self.main_window.root.after(33, self._flush_pending)
+        self._time_after_id = self.main_window.root.after(1000, self._tick_time)
+
+    def _tick_time(self):
+        """Refresh the clock display at 1 Hz -- it only changes once a minute"""
         if not self.gui_running:
             return
+        try:
+            self.main_window.update_time()
+        except tk.TclError:
+            return
+        self._time_after_id = self.main_window.root.after(1000, self._tick_time)
 
-        def _update():
-            try:
-                mqtt_connected = self.callbacks.get('is_mqtt_connected', lambda: False)()
-                controller_connected = self.robot_state.get_controller_connected()  # Uses timeout checking
-                self.main_window.update_controller_status(mqtt_connected, controller_connected)
-            except:
-                pass  # GUI might be destroyed
+    def _flush_pending(self):
+        """Drain the coalesced observer payloads to the widgets (Tk thread)"""
+        if not self.gui_running:
+            return
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        try:
+            if 'battery' in pending:
+                self.main_window.update_battery(pending['battery'])
+            if 'imu' in pending:
+                self.main_window.update_imu_data(pending['imu'])
+            if 'status' in pending:
+                self._apply_status(pending['status'])
+        except Exception as e:
+            if self.debug_mode:
+                print(f"⚠️ GUI update error: {e}")
+        self._flush_after_id = self.main_window.root.after(33, self._flush_pending)
+
+    def _periodic_tick(self):
+        """Periodic GUI refresh (runs on the Tk thread)"""
+        if not self.gui_running:
+            return
+        try:
+            self._update_controller_status()
+        except Exception as e:
+            if self.debug_mode:
+                print(f"⚠️ GUI update error: {e}")
+        self._tick_after_id = self.main_window.root.after(100, self._periodic_tick)
 
-        self.main_window.schedule_update(_update)
+    def _update_controller_status(self):
+        """Update controller connection status display (runs on the Tk thread)"""
+        try:
+            mqtt_connected = self._is_mqtt_connected()
+            controller_connected = self.robot_state.get_controller_connected()  # Uses timeout checking
+            # Connection state flips rarely; skip the widget churn on the
+            # ~99% of ticks where nothing changed
+            new_status = (mqtt_connected, controller_connected)
+            if new_status == self._last_controller_status:
+                return
+            self._last_controller_status = new_status
+            self.main_window.update_controller_status(mqtt_connected, controller_connected)
+        except tk.TclError:
+            pass  # GUI might be destroyed
 
     def _on_battery_update(self, data: Dict[str, Any]):
-        """Handle battery status updates"""
-        if self.debug_mode:
-            print(f"[GUI] Battery update: {data}")
-
-        def _update():
-            self.main_window.update_battery(data)
-
-        self.main_window.schedule_update(_update)
+        """Handle battery status updates (MQTT thread -- just stash the latest)"""
+        log.debug("Battery update: %s", data)
+        if data == self._last_payload['battery']:
+            return
+        self._last_payload['battery'] = data
+        with self._pending_lock:
+            self._pending['battery'] = data
 
     def _on_imu_update(self, data: Dict[str, Any]):
-        """Handle IMU data updates"""
-        if self.debug_mode:
-            print(f"[GUI] IMU update: {data}")
-
-        def _update():
-            self.main_window.update_imu_data(data)
-
-        self.main_window.schedule_update(_update)
+        """Handle IMU data updates (MQTT thread -- just stash the latest)"""
+        log.debug("IMU update: %s", data)
+        if data == self._last_payload['imu']:
+            return
+        self._last_payload['imu'] = data
+        # Every distinct sample is stashed: the latest-wins slot already
+        # caps painting at the flush rate, and skipping one here could leave
+        # the panel on a stale orientation if it was the burst's last sample
+        with self._pending_lock:
+            self._pending['imu'] = data
 
     def _on_status_update(self, data: Dict[str, Any]):
-        """Handle status updates"""
-        if self.debug_mode:
-            print(f"[GUI] Status update: {data}")
+        """Handle status updates (MQTT thread).
 
-        def _update():
-            # Update speed if changed
-            if 'speed_scale' in data:
-                self.main_window.update_speed(data['speed_scale'])
-
-            # Update CPU data if any CPU fields are present
-            cpu_fields = ['cpu_percent', 'cpu_temp', 'power_w']
-            if any(field in data for field in cpu_fields):
-                cpu_data = self.robot_state.get_cpu_data()
-                self.main_window.update_cpu_data(cpu_data)
-
-            # Update features
-            self.main_window.update_all_features(data)
-
-        self.main_window.schedule_update(_update)
+        Status payloads are changed-field deltas, so merge rather than
+        overwrite: two deltas inside one flush window must both land."""
+        log.debug("Status update: %s", data)
+        if data == self._last_payload['status']:
+            return
+        self._last_payload['status'] = dict(data)
+        with self._pending_lock:
+            if 'status' in self._pending:
+                self._pending['status'].update(data)
+            else:
+                self._pending['status'] = dict(data)
+
+    def _apply_status(self, data: Dict[str, Any]):
+        """Push a status delta to the widgets (Tk thread)"""
+        # Update speed if changed
+        if 'speed_scale' in data:
+            self.main_window.update_speed(data['speed_scale'])
+
+        # Update CPU data if any CPU fields are present
+        if not _CPU_FIELDS.isdisjoint(data):
+            cpu_percent, cpu_temp, power_w = self.robot_state.snapshot_cpu_data()
+            self.main_window.update_cpu_data({'cpu_percent': cpu_percent,
+                                              'cpu_temp': cpu_temp,
+                                              'power_w': power_w})
+
+        # Update features
+        self.main_window.update_all_features(data)
 
     def update_connection_status(self, connected: bool, message: str = None):
         """Update connection status"""
-        def _update():
-            self.main_window.update_connection_status(connected, message)
-
-        self.main_window.schedule_update(_update)
+        # partial() instead of a nested def: no cell/closure allocation per
+        # call, and the C-level dispatch is cheaper for the scheduler to invoke
+        self.main_window.schedule_update(
+            partial(self.main_window.update_connection_status, connected, message))
 
     def update_broker_host(self, new_host: str):
         """Update broker host"""
         self.broker_host = new_host
-        def _update():
-            self.main_window.update_title(new_host)
-
-        self.main_window.schedule_update(_update)
+        self.main_window.schedule_update(
+            partial(self.main_window.update_title, new_host))
 
     def update_image_display(self, image_data=None, success=True, error_message=None):
         """Update image display"""
-        def _update():
-            self.main_window.update_image_display(image_data, success, error_message)
-
-        self.main_window.schedule_update(_update)
+        # Keyed: if frames arrive faster than the drain, only the newest is painted
+        self.main_window.schedule_update(
+            partial(self.main_window.update_image_display, image_data, success, error_message),
+            key='image')
 
     def set_close_callback(self, callback: Callable):
         """Set callback for window close event"""
@@ -154,20 +223,25 @@ class GUIManager:
         print("🛑 Stopping GUI operations...")
         self.gui_running = False
 
-        # Don't wait for GUI thread - just mark it for stopping
-        if self.gui_thread and self.gui_thread.is_alive():
-            # Don't join - let it die naturally or be killed by process exit
-            pass
+        # Cancel the pending periodic tick and flush pump
+        for attr in ('_tick_after_id', '_flush_after_id', '_time_after_id'):
+            token = getattr(self, attr)
+            if token:
+                try:
+                    self.main_window.root.after_cancel(token)
+                except tk.TclError:
+                    pass
+                setattr(self, attr, None)
 
         # Force quit and destroy GUI immediately without any exception handling delays
         try:
             self.main_window.quit()
-        except:
+        except tk.TclError:
             pass
 
         try:
             self.main_window.destroy()
-        except:
+        except tk.TclError:
             pass
 
         print("🖥️ GUI stopped")
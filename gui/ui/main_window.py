@@ -1,30 +1,97 @@
 #!/usr/bin/env python3
 # coding=utf-8
 
+import logging
 import tkinter as tk
+import types
+from collections import deque
 from tkinter import ttk, messagebox, simpledialog
 from typing import Dict, Callable, Any, List
 from .status_widgets import BatteryWidget, ControllerWidget, SpeedWidget, CPUWidget, StatusBar
 from .control_panels import IMUPanel, FeaturesPanel, MovementPanel, ImageDisplayPanel
 
+# Shared option dicts, same pattern as control_panels: the container palette
+# and the repeated status-card pack options live in one place instead of
+# being retyped per widget call
+# Lifecycle tracing goes through logging: a disabled logger costs one
+# level check, where print() encoded the emoji strings and flushed
+# stdout on every close/error path
+log = logging.getLogger(__name__)
+
+BG_DARK = '#2b2b2b'  # window/container background (modern dark theme)
+DARK_FRAME = dict(bg=BG_DARK)
+CARD_GRID = dict(row=0, sticky='ew', padx=(0, 10), pady=5)
+
+
+def _noop(*args, **kwargs):
+    return None
+
+
+class _NullPanel:
+    """Stand-in for panels that haven't been built yet.
+
+    Swallows any update call, so the update_* paths dispatch straight
+    through a plain attribute lookup instead of branching on None."""
+    def __getattr__(self, name):
+        return _noop
+
+
 class MainWindow:
     def __init__(self, broker_host: str, callbacks: Dict[str, Callable], debug: bool = False):
         self.broker_host = broker_host
         self.callbacks = callbacks
         self.debug_mode = debug
+        # Resolve every callback once up front: widget construction then does
+        # plain attribute loads instead of a dict probe plus a fresh default
+        # lambda per .get(). Absent entries all share the module _noop
+        # (change_speed stays None -- SpeedWidget treats that as disabled).
+        self._cb = types.SimpleNamespace(
+            change_speed=callbacks.get('change_speed'),
+            toggle_roll_balance=callbacks.get('toggle_roll_balance', _noop),
+            set_volume=callbacks.get('set_volume', _noop),
+            set_led_brightness=callbacks.get('set_led_brightness', _noop),
+            change_height=callbacks.get('change_height', _noop),
+            change_body_tilt=callbacks.get('change_body_tilt', _noop),
+            emergency_stop=callbacks.get('emergency_stop', _noop),
+            reset_robot=callbacks.get('reset_robot', _noop),
+            reboot_pi=callbacks.get('reboot_pi', _noop),
+            poweroff_pi=callbacks.get('poweroff_pi', _noop),
+            request_image_capture=callbacks.get('request_image_capture', _noop),
+            reconnect=callbacks.get('reconnect', _noop),
+            disconnect=callbacks.get('disconnect', _noop),
+            change_robot_ip=callbacks.get('change_robot_ip'),
+        )
+        # The panel callback dicts never change after construction either;
+        # building them here means the create_*_row methods allocate nothing
+        self._feature_callbacks = {
+            'toggle_roll_balance': self._cb.toggle_roll_balance,
+            'set_volume': self._cb.set_volume,
+            'set_led_brightness': self._cb.set_led_brightness
+        }
+        self._movement_callbacks = {
+            'change_height': self._cb.change_height,
+            'change_body_tilt': self._cb.change_body_tilt,
+            'emergency_stop': self._cb.emergency_stop,
+            'reset_robot': self._cb.reset_robot,
+            'reboot_pi': self._cb.reboot_pi,
+            'poweroff_pi': self._cb.poweroff_pi
+        }
         self.setup_main_window()
         self.create_widgets()
-        self.create_menu()
+        # Menus aren't needed to show the window -- build them on the first
+        # idle pass so the main layout reaches the screen sooner
+        self.root.after_idle(self.create_menu)
 
     def setup_main_window(self):
         """Setup the main window"""
         self.root = tk.Tk()
         self.root.title(f"Rider Robot PC Client - {self.broker_host}")
         self.root.geometry("1200x1000")
-        self.root.configure(bg='#2b2b2b')  # Modern dark theme
+        self.root.configure(bg=BG_DARK)
 
-        # Configure root window to use grid with proper weights (key for resizing!)
-        self.root.grid_rowconfigure(0, weight=0)  # Status bar row (fixed height)
+        # Configure root window to use grid with proper weights (key for
+        # resizing!). weight=0 is the grid default, so only the expandable
+        # rows/columns need configuring -- row 0 (status bar) stays fixed.
         self.root.grid_rowconfigure(1, weight=1)  # Main content row (expandable)
         self.root.grid_columnconfigure(0, weight=1)
 
@@ -33,29 +100,50 @@ class MainWindow:
         self.root.minsize(width=900, height=700)
         self.root.maxsize(width=2000, height=1500)  # Set reasonable maximum size
 
+        # Cross-thread callbacks queue here and drain once per ~frame; a
+        # deque append is cheap and thread-safe, where a root.after(0) per
+        # event posts an individual Tcl event each time
+        self._cb_queue = deque()
+        self._cb_keyed = {}
+        self.root.after(16, self._drain_cb_queue)
+
         # Set aggressive window closing behavior
         # This prevents the window from being closed normally - all closes go through our handler
         self.root.protocol("WM_DELETE_WINDOW", self._emergency_close)
 
     def create_widgets(self):
-        """Create all GUI widgets"""
+        """Create all GUI widgets.
+
+        Widget construction dominates Tk startup, so only the status bar and
+        the top status cards are built before first paint; the heavier middle
+        and bottom rows (panels, camera display) follow on the first idle
+        pass, after the window is already on screen."""
         # Status bar at top
         self.status_bar = StatusBar(self.root, self.broker_host)
         self.status_bar.get_widget().grid(row=0, column=0, sticky="ew")
 
         # Main container with padding - use grid to work with root grid configuration
-        main_container = tk.Frame(self.root, bg='#2b2b2b')
+        main_container = tk.Frame(self.root, **DARK_FRAME)
         main_container.grid(row=1, column=0, sticky="nsew", padx=15, pady=15)
 
-        # Configure main container grid weights for proper resizing
-        main_container.grid_rowconfigure(0, weight=0)  # Top row (status cards) - fixed height
-        main_container.grid_rowconfigure(1, weight=0)  # Middle row (IMU/Features) - fixed height
+        # Configure main container grid weights for proper resizing; rows 0-1
+        # (status cards, IMU/Features) keep the fixed-height default
         main_container.grid_rowconfigure(2, weight=1)  # Bottom row (Robot Control/Camera) - expandable
         main_container.grid_columnconfigure(0, weight=1)
 
         # Top row - Status cards
         self.create_status_row(main_container)
 
+        # Deferred rows: null-object placeholders silently absorb updates
+        # until the real panels replace them on the first idle pass
+        self.imu_panel = _NullPanel()
+        self.features_panel = _NullPanel()
+        self.movement_panel = _NullPanel()
+        self.image_panel = _NullPanel()
+        self.root.after_idle(self._create_deferred_rows, main_container)
+
+    def _create_deferred_rows(self, main_container):
+        """Build the middle and bottom rows (runs on the first idle pass)"""
         # Middle row - IMU Data and Robot Features
         self.create_middle_row(main_container)
 
@@ -66,108 +154,104 @@ class MainWindow:
         self.sizegrip = ttk.Sizegrip(self.root)
         self.sizegrip.grid(row=1, column=0, sticky="se")
 
-        # Force update and then enable resizing
-        self.root.update_idletasks()
-        self.root.resizable(True, True)  # Force resizable again after layout
-
     def create_status_row(self, parent):
         """Create the top status row with battery, controller, CPU, and speed"""
-        status_row = tk.Frame(parent, bg='#2b2b2b')
+        status_row = tk.Frame(parent, **DARK_FRAME)
         status_row.grid(row=0, column=0, sticky="ew", pady=(0, 15))
 
+        # One uniform group for the four cards: Tk computes the shared column
+        # width once instead of re-measuring per card as pack() did
+        for col in range(4):
+            status_row.grid_columnconfigure(col, weight=1, uniform='status')
+
         # Battery Status Card
         self.battery_widget = BatteryWidget(status_row)
-        self.battery_widget.get_widget().pack(side='left', padx=(0, 10), pady=5, fill='x', expand=True)
+        self.battery_widget.get_widget().grid(column=0, **CARD_GRID)
 
         # Controller Status Card
         self.controller_widget = ControllerWidget(status_row)
-        self.controller_widget.get_widget().pack(side='left', padx=(0, 10), pady=5, fill='x', expand=True)
+        self.controller_widget.get_widget().grid(column=1, **CARD_GRID)
 
         # CPU Status Card
         self.cpu_widget = CPUWidget(status_row)
-        self.cpu_widget.get_widget().pack(side='left', padx=(0, 10), pady=5, fill='x', expand=True)
+        self.cpu_widget.get_widget().grid(column=2, **CARD_GRID)
 
         # Speed Control Card (disabled -- no settings backend on the balance firmware)
-        speed_callback = self.callbacks.get('change_speed', None)
-        self.speed_widget = SpeedWidget(status_row, speed_callback)
-        self.speed_widget.get_widget().pack(side='left', pady=5, fill='x', expand=True)
+        self.speed_widget = SpeedWidget(status_row, self._cb.change_speed)
+        self.speed_widget.get_widget().grid(row=0, column=3, sticky="ew", pady=5)
 
     def create_middle_row(self, parent):
         """Create the middle row with IMU and features panels"""
-        middle_row = tk.Frame(parent, bg='#2b2b2b')
+        middle_row = tk.Frame(parent, **DARK_FRAME)
         middle_row.grid(row=1, column=0, sticky="ew", pady=(0, 15))
 
-        # Configure middle row for fixed height panels
-        middle_row.grid_rowconfigure(0, weight=0)  # Don't expand vertically
-        middle_row.grid_columnconfigure(0, weight=1)
-        middle_row.grid_columnconfigure(1, weight=1)
+        # Both panel columns share the width (one uniform measure pass);
+        # row 0 keeps the non-expanding default
+        for col in (0, 1):
+            middle_row.grid_columnconfigure(col, weight=1, uniform='panels')
 
         # IMU Data Panel (Left)
         self.imu_panel = IMUPanel(middle_row)
         self.imu_panel.get_widget().grid(row=0, column=0, sticky="ew", padx=(0, 10))
 
         # Robot Features Panel (Right)
-        feature_callbacks = {
-            'toggle_roll_balance': self.callbacks.get('toggle_roll_balance', lambda: None),
-            'set_volume': self.callbacks.get('set_volume', lambda v: None),
-            'set_led_brightness': self.callbacks.get('set_led_brightness', lambda v: None)
-        }
-        self.features_panel = FeaturesPanel(middle_row, feature_callbacks)
+        self.features_panel = FeaturesPanel(middle_row, self._feature_callbacks)
         self.features_panel.get_widget().grid(row=0, column=1, sticky="ew")
 
     def create_bottom_row(self, parent):
         """Create the bottom row with robot controls and the camera image panel"""
         # Create bottom row container
-        bottom_row = tk.Frame(parent, bg='#2b2b2b')
+        bottom_row = tk.Frame(parent, **DARK_FRAME)
         bottom_row.grid(row=2, column=0, sticky="nsew", pady=(0, 0))
 
-        # Configure bottom row grid - 2 columns: controls, image
+        # Configure bottom row grid - 2 columns: controls (fixed-size default), image
         bottom_row.grid_rowconfigure(0, weight=1)
-        bottom_row.grid_columnconfigure(0, weight=0)  # Robot control column - fixed size
         bottom_row.grid_columnconfigure(1, weight=1)  # Image display column - expandable
 
         # Robot Control Panel (Left side - fixed width to fit controls)
-        movement_callbacks = {
-            'change_height': self.callbacks.get('change_height', lambda h: None),
-            'change_body_tilt': self.callbacks.get('change_body_tilt', lambda t: None),
-            'emergency_stop': self.callbacks.get('emergency_stop', lambda: None),
-            'reset_robot': self.callbacks.get('reset_robot', lambda: None),
-            'reboot_pi': self.callbacks.get('reboot_pi', lambda: None),
-            'poweroff_pi': self.callbacks.get('poweroff_pi', lambda: None)
-        }
-        self.movement_panel = MovementPanel(bottom_row, movement_callbacks)
+        self.movement_panel = MovementPanel(bottom_row, self._movement_callbacks)
         self.movement_panel.get_widget().grid(row=0, column=0, sticky="ns", padx=(0, 10))
 
         # Image Display Panel (Center - expandable)
-        image_callback = self.callbacks.get('request_image_capture', lambda resolution: None)
-        self.image_panel = ImageDisplayPanel(bottom_row, image_callback)
+        self.image_panel = ImageDisplayPanel(bottom_row, self._cb.request_image_capture)
         self.image_panel.get_widget().grid(row=0, column=1, sticky="nsew")
 
     def create_menu(self):
-        """Create menu bar"""
+        """Create menu bar (empty cascades; entries fill in on first drop)"""
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
 
-        # Connection menu
-        connection_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Connection", menu=connection_menu)
-        connection_menu.add_command(label="Change Robot IP", command=self._change_robot_ip)
-        connection_menu.add_separator()
-        connection_menu.add_command(label="Reconnect", command=self.callbacks.get('reconnect', lambda: None))
-        connection_menu.add_command(label="Disconnect", command=self.callbacks.get('disconnect', lambda: None))
-
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="About", command=self._show_about)
+        # postcommand fires just before a cascade posts, so the add_command
+        # work runs when the menu is first opened rather than at startup
+        self._connection_menu = tk.Menu(menubar, tearoff=0,
+                                        postcommand=self._populate_connection_menu)
+        menubar.add_cascade(label="Connection", menu=self._connection_menu)
+
+        self._help_menu = tk.Menu(menubar, tearoff=0,
+                                  postcommand=self._populate_help_menu)
+        menubar.add_cascade(label="Help", menu=self._help_menu)
+
+    def _populate_connection_menu(self):
+        """Fill the Connection cascade (called by Tk each time it posts)"""
+        menu = self._connection_menu
+        menu.delete(0, 'end')
+        menu.add_command(label="Change Robot IP", command=self._change_robot_ip)
+        menu.add_separator()
+        menu.add_command(label="Reconnect", command=self._cb.reconnect)
+        menu.add_command(label="Disconnect", command=self._cb.disconnect)
+
+    def _populate_help_menu(self):
+        """Fill the Help cascade (called by Tk each time it posts)"""
+        menu = self._help_menu
+        menu.delete(0, 'end')
+        menu.add_command(label="About", command=self._show_about)
 
     def _change_robot_ip(self):
         """Change robot IP address"""
         new_ip = simpledialog.askstring("Robot IP", "Enter robot IP address:", initialvalue=self.broker_host)
         if new_ip and new_ip != self.broker_host:
-            change_ip_callback = self.callbacks.get('change_robot_ip')
-            if change_ip_callback:
-                change_ip_callback(new_ip)
+            if self._cb.change_robot_ip:
+                self._cb.change_robot_ip(new_ip)
 
     def _show_about(self):
         """Show about dialog"""
@@ -186,33 +270,61 @@ class MainWindow:
     def mainloop(self):
         """Start the GUI main loop"""
         try:
-            print("🖥️ Starting GUI...")
+            log.info("Starting GUI")
             self.root.mainloop()
         except KeyboardInterrupt:
-            print("\n⌨️ Keyboard interrupt received...")
-        except Exception as e:
-            print(f"❌ GUI error: {e}")
+            log.info("Keyboard interrupt received")
+        except Exception:
+            log.exception("GUI error")
 
     def quit(self):
         """Quit the GUI"""
         try:
             self.root.quit()
-        except:
-            pass
+        except tk.TclError:
+            pass  # Interpreter already torn down
 
     def destroy(self):
         """Destroy the GUI"""
         try:
             self.root.destroy()
-        except:
-            pass
-
-    def schedule_update(self, callback: Callable):
-        """Schedule a callback to run in the main GUI thread"""
+        except tk.TclError:
+            pass  # Interpreter already torn down
+
+    def schedule_update(self, callback: Callable, key: str = None):
+        """Schedule a callback to run in the main GUI thread.
+
+        With a key, only the newest callback per key survives until the next
+        drain -- high-rate producers (e.g. video frames) then paint at
+        display rate instead of queueing a backlog of stale updates."""
+        if key is None:
+            self._cb_queue.append(callback)
+        else:
+            self._cb_keyed[key] = callback
+
+    def _drain_cb_queue(self):
+        """Run queued cross-thread callbacks in one batch per ~16ms frame"""
+        while self._cb_queue:
+            callback = self._cb_queue.popleft()
+            try:
+                callback()
+            except tk.TclError:
+                pass  # GUI might be destroyed
+            except Exception:
+                log.exception("GUI update error")
+        if self._cb_keyed:
+            keyed, self._cb_keyed = self._cb_keyed, {}
+            for callback in keyed.values():
+                try:
+                    callback()
+                except tk.TclError:
+                    pass  # GUI might be destroyed
+                except Exception:
+                    log.exception("GUI update error")
         try:
-            self.root.after(0, callback)
-        except:
-            pass  # GUI might be destroyed
+            self.root.after(16, self._drain_cb_queue)
+        except tk.TclError:
+            pass  # GUI destroyed -- stop re-arming
 
     # Widget update methods
     def update_connection_status(self, connected: bool, message: str = None):
@@ -257,5 +369,5 @@ class MainWindow:
 
     def _emergency_close(self):
         """Emergency close handler"""
-        print("🚨 Emergency close requested...")
+        log.warning("Emergency close requested")
         self.quit()
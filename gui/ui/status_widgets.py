@@ -1,13 +1,77 @@
 #!/usr/bin/env python3
 # coding=utf-8
 
+import sys
+import time
 import tkinter as tk
-from datetime import datetime
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Callable, Optional, Dict
 
+# Shared status colors, interned so the skip-if-unchanged caches can rely
+# on pointer identity and every config site passes the same string object
+C_GREEN = sys.intern('#4caf50')
+C_ORANGE = sys.intern('#ff9800')
+C_RED = sys.intern('#f44336')
+C_REDORANGE = sys.intern('#ff5722')
+C_GREY = sys.intern('#808080')
+C_YELLOW = sys.intern('#ffd73c')
+C_TEMP_RED = sys.intern('#ff5a5a')
+C_BLUE = sys.intern('#42a5f5')
+
+# Display strings keyed by the quantized integer value: the widgets only
+# ever show a few hundred distinct strings, so formatting becomes a dict
+# hit instead of a float-to-string conversion per tick
+@lru_cache(maxsize=1024)
+def _pct1(tenths: int) -> str:
+    return f"{tenths / 10:.1f}%"
+
+@lru_cache(maxsize=256)
+def _degc(deg: int) -> str:
+    return f"{deg}°C"
+
+@lru_cache(maxsize=256)
+def _watts1(tenths: int) -> str:
+    return f"{tenths / 10:.1f}W"
+
+@lru_cache(maxsize=32)
+def _speed1(tenths: int) -> str:
+    return f"{tenths / 10:.1f}x"
+
+# Threshold -> color bands, shared by the labels and the bar fills. One
+# bisect into a sorted tuple replaces the duplicated if/elif ladders:
+# colors[i] applies to values in [thresh[i-1], thresh[i]).
+_BATTERY_THRESH = (20, 40, 70)
+_BATTERY_COLORS = (C_RED, C_REDORANGE, C_ORANGE, C_GREEN)
+_CPU_THRESH = (600, 800)  # tenths of a percent, matching the quantized updates
+_CPU_COLORS = (C_GREEN, C_ORANGE, C_RED)
+# match the Pi LCD temp thresholds/colors: yellow >=70 (255,215,60), red >=80 (255,90,90)
+_TEMP_THRESH = (70, 80)
+_TEMP_COLORS = (C_GREEN, C_YELLOW, C_TEMP_RED)
+
+def _pick(thresholds, colors, value):
+    """Pick the color band for value from a sorted threshold table"""
+    return colors[bisect_right(thresholds, value)]
+
 class BatteryWidget:
+    # Slotted like the other status cards: the update paths hammer these
+    # attributes every tick, and slots skip the per-instance dict lookup
+    __slots__ = ('parent', 'card', 'canvas', 'label', 'text_var',
+                 '_last_level', '_last_color', '_fill_id')
+
+    # Icon geometry never changes -- body 30x16 at (5,2), 3x8 terminal
+    # centered on the right edge, fill inset 2px inside the body
+    _X1, _Y1, _X2, _Y2 = 5, 2, 35, 18
+    _TERM = (35, 6, 38, 14)
+    _FILL_X1, _FILL_Y1, _FILL_Y2 = 7, 4, 16
+    _FILL_MAX = 26
+
     def __init__(self, parent):
         self.parent = parent
+        # Last level/color actually drawn -- steady-state ticks repeat the
+        # same value, and skipping them saves the canvas redraw round-trips
+        self._last_level = None
+        self._last_color = None
         self.setup_widget()
 
     def setup_widget(self):
@@ -26,90 +90,63 @@ class BatteryWidget:
                                highlightthickness=0, bd=0)
         self.canvas.pack(side='left', padx=(0, 10))
 
-        # Battery percentage label
-        self.label = tk.Label(display, text="0%", font=('Arial', 16, 'bold'),
+        # Battery percentage label -- a StringVar write is a plain Tcl
+        # variable set, cheaper than config's option parsing (same pattern
+        # for the other dynamic value labels below)
+        self.text_var = tk.StringVar(value="0%")
+        self.label = tk.Label(display, textvariable=self.text_var, font=('Arial', 16, 'bold'),
                              bg='#3c3c3c', fg='red')
         self.label.pack(side='left')
 
-        # Draw initial battery outline
-        self.draw_battery_icon(0)
-
-    def draw_battery_icon(self, battery_level):
-        """Draw a battery icon that fills based on battery level"""
-        # Clear the canvas
-        self.canvas.delete("all")
-
-        # Battery dimensions
-        battery_width = 30
-        battery_height = 16
-        terminal_width = 3
-        terminal_height = 8
-
-        # Calculate battery body position (centered in canvas)
-        x1 = 5
-        y1 = 2
-        x2 = x1 + battery_width
-        y2 = y1 + battery_height
-
-        # Draw battery outline (white)
-        self.canvas.create_rectangle(x1, y1, x2, y2, outline='white', width=2, fill='#2b2b2b')
-
-        # Draw battery terminal (small rectangle on right side)
-        terminal_x1 = x2
-        terminal_y1 = y1 + (battery_height - terminal_height) // 2
-        terminal_x2 = terminal_x1 + terminal_width
-        terminal_y2 = terminal_y1 + terminal_height
-        self.canvas.create_rectangle(terminal_x1, terminal_y1, terminal_x2, terminal_y2,
+        # Static outline and terminal are drawn once; only the fill item is
+        # touched on updates (coords/itemconfig instead of delete + recreate)
+        self.canvas.create_rectangle(self._X1, self._Y1, self._X2, self._Y2,
                                    outline='white', width=2, fill='#2b2b2b')
+        self.canvas.create_rectangle(*self._TERM,
+                                   outline='white', width=2, fill='#2b2b2b')
+
+        # Persistent fill item, hidden until there's a level to show
+        self._fill_id = self.canvas.create_rectangle(0, 0, 0, 0, outline='',
+                                                     fill=C_GREEN, state='hidden')
 
-        # Draw battery fill based on level
-        if battery_level > 0:
-            fill_width = max(1, int((battery_width - 4) * battery_level / 100))  # -4 for padding
-            fill_x1 = x1 + 2
-            fill_y1 = y1 + 2
-            fill_x2 = fill_x1 + fill_width
-            fill_y2 = y2 - 2
-
-            # Color based on battery level
-            if battery_level >= 70:
-                fill_color = '#4caf50'  # Green
-            elif battery_level >= 40:
-                fill_color = '#ff9800'  # Orange
-            elif battery_level >= 20:
-                fill_color = '#ff5722'  # Red-orange
-            else:
-                fill_color = '#f44336'  # Red
-
-            self.canvas.create_rectangle(fill_x1, fill_y1, fill_x2, fill_y2,
-                                       outline='', fill=fill_color)
+    def draw_battery_icon(self, battery_level, fill_color):
+        """Update the battery icon fill for the given level"""
+        if battery_level <= 0:
+            self.canvas.itemconfig(self._fill_id, state='hidden')
+            return
+
+        fill_width = max(1, self._FILL_MAX * battery_level // 100)
+        self.canvas.coords(self._fill_id, self._FILL_X1, self._FILL_Y1,
+                           self._FILL_X1 + fill_width, self._FILL_Y2)
+        self.canvas.itemconfig(self._fill_id, fill=fill_color, state='normal')
 
     def update_battery(self, data):
         """Update battery display"""
         battery_level = data.get('level', 0)
+        if battery_level == self._last_level:
+            return
+        self._last_level = battery_level
 
         # Update battery percentage label
-        self.label.config(text=f"{battery_level}%")
+        self.text_var.set(f"{battery_level}%")
+
+        # One lookup covers both the fill and the label color
+        color = _pick(_BATTERY_THRESH, _BATTERY_COLORS, battery_level)
 
         # Update battery icon
-        self.draw_battery_icon(battery_level)
-
-        # Update percentage label color based on battery level
-        if battery_level >= 70:
-            color = '#4caf50'  # Green
-        elif battery_level >= 40:
-            color = '#ff9800'  # Orange
-        elif battery_level >= 20:
-            color = '#ff5722'  # Red-orange
-        else:
-            color = '#f44336'  # Red
+        self.draw_battery_icon(battery_level, color)
 
-        self.label.config(fg=color)
+        if color is not self._last_color:
+            self._last_color = color
+            self.label.config(fg=color)
 
     def get_widget(self):
         """Get the main widget"""
         return self.card
 
 class ControllerWidget:
+    __slots__ = ('parent', 'card', 'icon', '_alive')
+
     def __init__(self, parent):
         self.parent = parent
         self.setup_widget()
@@ -120,32 +157,46 @@ class ControllerWidget:
 
         # Controller icon - color changes based on status
         self.icon = tk.Label(self.card, text="🎮", font=('Arial', 30),
-                           bg='#3c3c3c', fg='#808080')  # Start with grey
+                           bg='#3c3c3c', fg=C_GREY)  # Start with grey
         self.icon.pack(pady=15)
 
+        # Teardown flag instead of a per-update try/except: the updates
+        # check one attribute rather than paying an exception frame per tick
+        self._alive = True
+        self.card.bind('<Destroy>', self._on_destroy)
+
+    def _on_destroy(self, event):
+        self._alive = False
+
     def update_status(self, is_mqtt_connected, is_controller_connected):
         """Update controller connection status display"""
-        try:
-            if not is_mqtt_connected:
-                # MQTT not connected - grey
-                self.icon.config(fg='#808080')
-            elif is_controller_connected:
-                # MQTT connected AND controller responding - green
-                self.icon.config(fg='#4caf50')
-            else:
-                # MQTT connected but no controller response - red
-                self.icon.config(fg='#f44336')
-        except:
-            pass  # GUI might be destroyed
+        if not self._alive:
+            return  # GUI destroyed
+        if not is_mqtt_connected:
+            # MQTT not connected - grey
+            self.icon.config(fg=C_GREY)
+        elif is_controller_connected:
+            # MQTT connected AND controller responding - green
+            self.icon.config(fg=C_GREEN)
+        else:
+            # MQTT connected but no controller response - red
+            self.icon.config(fg=C_RED)
 
     def get_widget(self):
         """Get the main widget"""
         return self.card
 
 class SpeedWidget:
+    __slots__ = ('parent', 'on_speed_change', 'card', 'label', 'text_var',
+                 'scale', '_pending', '_after_id')
+
     def __init__(self, parent, on_speed_change: Optional[Callable] = None):
         self.parent = parent
         self.on_speed_change = on_speed_change
+        # Scale drags fire the command per pixel; coalesce to the latest
+        # value and flush once per 30ms so the callback isn't flooded
+        self._pending = None
+        self._after_id = None
         self.setup_widget()
 
     def setup_widget(self):
@@ -156,7 +207,8 @@ class SpeedWidget:
         tk.Label(self.card, text="⚡ SPEED", font=('Arial', 10, 'bold'),
                 bg='#3c3c3c', fg='#87ceeb').pack(pady=(8, 2))
 
-        self.label = tk.Label(self.card, text="1.0x", font=('Arial', 16, 'bold'),
+        self.text_var = tk.StringVar(value="1.0x")
+        self.label = tk.Label(self.card, textvariable=self.text_var, font=('Arial', 16, 'bold'),
                              bg='#3c3c3c', fg='white')
         self.label.pack(pady=(0, 5))
 
@@ -168,15 +220,21 @@ class SpeedWidget:
         self.scale.pack(pady=(0, 8))
 
     def _speed_changed(self, value):
-        """Handle speed scale change"""
-        speed_val = float(value)
-        self.label.config(text=f"{speed_val:.1f}x")
+        """Handle speed scale change -- stash the value, flush debounced"""
+        self._pending = float(value)
+        if self._after_id is None:
+            self._after_id = self.card.after(30, self._flush)
+
+    def _flush(self):
+        """Apply the latest coalesced speed value"""
+        self._after_id = None
+        speed_val = self._pending
+        self.text_var.set(_speed1(int(round(speed_val * 10))))
         if self.on_speed_change:
             self.on_speed_change(speed_val)
 
     def update_speed(self, speed_value):
-        """Update speed display"""
-        self.label.config(text=f"{speed_value:.1f}x")
+        """Update speed display (goes through the same debounced flush)"""
         self.scale.set(speed_value)
 
     def get_widget(self):
@@ -184,8 +242,20 @@ class SpeedWidget:
         return self.card
 
 class CPUWidget:
+    __slots__ = ('parent', 'card', '_alive',
+                 'cpu_canvas', 'cpu_var', 'cpu_value_label', '_cpu_w',
+                 'temp_canvas', 'temp_var', 'temp_value_label', '_temp_w',
+                 'pwr_canvas', 'pwr_var', 'pwr_value_label', '_pwr_w',
+                 '_cpu_fill_id', '_temp_fill_id', '_pwr_fill_id',
+                 '_last_cpu', '_last_temp', '_last_pwr')
+
     def __init__(self, parent):
         self.parent = parent
+        # Last drawn values, quantized to display precision -- a tick that
+        # wouldn't change any pixel skips the label config and bar redraw
+        self._last_cpu = None
+        self._last_temp = None
+        self._last_pwr = None
         self.setup_widget()
 
     def setup_widget(self):
@@ -199,12 +269,16 @@ class CPUWidget:
         tk.Label(cpu_frame, text="CPU", font=('Arial', 8),
                 bg='#3c3c3c', fg='#87ceeb', width=5, anchor='w').pack(side='left')
 
-        # Make canvas expand to fill most of available space
-        self.cpu_canvas = tk.Canvas(cpu_frame, height=24, bg='#2b2b2b',
+        # Make canvas expand to fill most of available space; track its
+        # width from <Configure> so draws never query the layout engine
+        self.cpu_canvas = tk.Canvas(cpu_frame, height=24, width=240, bg='#2b2b2b',
                                    highlightthickness=0, bd=0)
         self.cpu_canvas.pack(side='left', padx=(5, 5), fill='x', expand=True)
+        self._cpu_w = 240
+        self.cpu_canvas.bind('<Configure>', self._on_cpu_configure)
 
-        self.cpu_value_label = tk.Label(cpu_frame, text="0%", font=('Arial', 9, 'bold'),
+        self.cpu_var = tk.StringVar(value="0%")
+        self.cpu_value_label = tk.Label(cpu_frame, textvariable=self.cpu_var, font=('Arial', 9, 'bold'),
                                        bg='#3c3c3c', fg='#cccccc', width=6, anchor='e')
         self.cpu_value_label.pack(side='left')
 
@@ -215,11 +289,14 @@ class CPUWidget:
         tk.Label(temp_frame, text="Temp", font=('Arial', 8),
                 bg='#3c3c3c', fg='#87ceeb', width=5, anchor='w').pack(side='left')
 
-        self.temp_canvas = tk.Canvas(temp_frame, height=24, bg='#2b2b2b',
+        self.temp_canvas = tk.Canvas(temp_frame, height=24, width=240, bg='#2b2b2b',
                                     highlightthickness=0, bd=0)
         self.temp_canvas.pack(side='left', padx=(5, 5), fill='x', expand=True)
+        self._temp_w = 240
+        self.temp_canvas.bind('<Configure>', self._on_temp_configure)
 
-        self.temp_value_label = tk.Label(temp_frame, text="0°C", font=('Arial', 9, 'bold'),
+        self.temp_var = tk.StringVar(value="0°C")
+        self.temp_value_label = tk.Label(temp_frame, textvariable=self.temp_var, font=('Arial', 9, 'bold'),
                                         bg='#3c3c3c', fg='#cccccc', width=6, anchor='e')
         self.temp_value_label.pack(side='left')
 
@@ -230,109 +307,110 @@ class CPUWidget:
         tk.Label(pwr_frame, text="Pwr", font=('Arial', 8),
                 bg='#3c3c3c', fg='#87ceeb', width=5, anchor='w').pack(side='left')
 
-        self.pwr_canvas = tk.Canvas(pwr_frame, height=24, bg='#2b2b2b',
+        self.pwr_canvas = tk.Canvas(pwr_frame, height=24, width=240, bg='#2b2b2b',
                                     highlightthickness=0, bd=0)
         self.pwr_canvas.pack(side='left', padx=(5, 5), fill='x', expand=True)
+        self._pwr_w = 240
+        self.pwr_canvas.bind('<Configure>', self._on_pwr_configure)
 
-        self.pwr_value_label = tk.Label(pwr_frame, text="0.0W", font=('Arial', 9, 'bold'),
+        self.pwr_var = tk.StringVar(value="0.0W")
+        self.pwr_value_label = tk.Label(pwr_frame, textvariable=self.pwr_var, font=('Arial', 9, 'bold'),
                                         bg='#3c3c3c', fg='#cccccc', width=6, anchor='e')
         self.pwr_value_label.pack(side='left')
 
-        # Draw initial empty bars
-        self.draw_cpu_bar(0)
-        self.draw_temp_bar(0)
-        self.draw_power_bar(0)
-
-    def draw_cpu_bar(self, cpu_percent):
-        """Draw CPU percentage bar"""
-        self.cpu_canvas.delete("all")
-
-        # Get current canvas width dynamically
-        self.cpu_canvas.update_idletasks()
-        canvas_width = self.cpu_canvas.winfo_width()
-        canvas_height = self.cpu_canvas.winfo_height()
-
-        # Draw fill based on CPU percentage directly on canvas background
-        if cpu_percent > 0:
-            fill_x1 = 0
-            fill_y1 = 0
-            fill_width = int(canvas_width * cpu_percent / 100)
-            fill_x2 = fill_x1 + fill_width
-            fill_y2 = canvas_height
-
-            # Ensure minimum width if there's any value
-            if fill_width < 1 and cpu_percent > 0:
-                fill_width = 1
-                fill_x2 = fill_x1 + fill_width
-
-            # Color based on CPU usage
-            if cpu_percent >= 80:
-                fill_color = '#f44336'  # Red - high load
-            elif cpu_percent >= 60:
-                fill_color = '#ff9800'  # Orange - moderate load
-            else:
-                fill_color = '#4caf50'  # Green - normal load
-
-            # Draw the fill rectangle directly on canvas using full width
-            self.cpu_canvas.create_rectangle(fill_x1, fill_y1, fill_x2, fill_y2,
-                                           outline='', fill=fill_color)
+        # One persistent fill item per bar -- updates move/recolor it via
+        # coords/itemconfig instead of delete("all") + create_rectangle
+        self._cpu_fill_id = self.cpu_canvas.create_rectangle(0, 0, 0, 0, outline='',
+                                                             fill=C_GREEN, state='hidden')
+        self._temp_fill_id = self.temp_canvas.create_rectangle(0, 0, 0, 0, outline='',
+                                                               fill=C_GREEN, state='hidden')
+        self._pwr_fill_id = self.pwr_canvas.create_rectangle(0, 0, 0, 0, outline='',
+                                                             fill=C_BLUE, state='hidden')
+
+        # Same teardown flag as ControllerWidget -- see _on_destroy
+        self._alive = True
+        self.card.bind('<Destroy>', self._on_destroy)
+
+    def _on_destroy(self, event):
+        self._alive = False
+
+    def _on_cpu_configure(self, event):
+        """Cache the CPU bar width and rescale the fill to the new size"""
+        self._cpu_w = event.width
+        if self._last_cpu:
+            self.draw_cpu_bar(self._last_cpu)
+
+    def _on_temp_configure(self, event):
+        """Cache the temp bar width and rescale the fill to the new size"""
+        self._temp_w = event.width
+        if self._last_temp:
+            self.draw_temp_bar(self._last_temp)
+
+    def _on_pwr_configure(self, event):
+        """Cache the power bar width and rescale the fill to the new size"""
+        self._pwr_w = event.width
+        if self._last_pwr:
+            self.draw_power_bar(self._last_pwr)
+
+    def draw_cpu_bar(self, cpu_tenths):
+        """Update the CPU percentage bar (value in tenths of a percent)"""
+        if cpu_tenths <= 0:
+            self.cpu_canvas.itemconfig(self._cpu_fill_id, state='hidden')
+            return
+
+        fill_width = max(1, self._cpu_w * cpu_tenths // 1000)
+        fill_color = _pick(_CPU_THRESH, _CPU_COLORS, cpu_tenths)
+
+        self.cpu_canvas.coords(self._cpu_fill_id, 0, 0, fill_width, 24)
+        self.cpu_canvas.itemconfig(self._cpu_fill_id, fill=fill_color, state='normal')
 
     def draw_temp_bar(self, temp_c):
-        """Draw CPU temperature bar (0-100°C scale)"""
-        self.temp_canvas.delete("all")
-
-        self.temp_canvas.update_idletasks()
-        canvas_width = self.temp_canvas.winfo_width()
-        canvas_height = self.temp_canvas.winfo_height()
-
-        if temp_c > 0:
-            fill_width = int(canvas_width * min(temp_c, 100) / 100)
-            if fill_width < 1:
-                fill_width = 1
-
-            # match the Pi LCD temp thresholds/colors: yellow >=70, red >=80
-            if temp_c >= 80:
-                fill_color = '#ff5a5a'   # Red (255,90,90)
-            elif temp_c >= 70:
-                fill_color = '#ffd73c'   # Yellow (255,215,60)
-            else:
-                fill_color = '#4caf50'   # Green (cool)
-
-            self.temp_canvas.create_rectangle(0, 0, fill_width, canvas_height,
-                                              outline='', fill=fill_color)
-
-    def draw_power_bar(self, watts):
-        """Draw CM5 module power bar (0-15W scale)"""
-        self.pwr_canvas.delete("all")
-        self.pwr_canvas.update_idletasks()
-        canvas_width = self.pwr_canvas.winfo_width()
-        canvas_height = self.pwr_canvas.winfo_height()
-        if watts > 0:
-            fill_width = int(canvas_width * min(watts, 15.0) / 15.0)
-            if fill_width < 1:
-                fill_width = 1
-            self.pwr_canvas.create_rectangle(0, 0, fill_width, canvas_height,
-                                             outline='', fill='#42a5f5')
+        """Update the CPU temperature bar (0-100°C scale)"""
+        if temp_c <= 0:
+            self.temp_canvas.itemconfig(self._temp_fill_id, state='hidden')
+            return
+
+        fill_width = max(1, self._temp_w * min(temp_c, 100) // 100)
+        fill_color = _pick(_TEMP_THRESH, _TEMP_COLORS, temp_c)
+
+        self.temp_canvas.coords(self._temp_fill_id, 0, 0, fill_width, 24)
+        self.temp_canvas.itemconfig(self._temp_fill_id, fill=fill_color, state='normal')
+
+    def draw_power_bar(self, pwr_tenths):
+        """Update the CM5 module power bar (value in tenths of a watt, 0-15W scale)"""
+        if pwr_tenths <= 0:
+            self.pwr_canvas.itemconfig(self._pwr_fill_id, state='hidden')
+            return
+        fill_width = max(1, self._pwr_w * min(pwr_tenths, 150) // 150)
+        self.pwr_canvas.coords(self._pwr_fill_id, 0, 0, fill_width, 24)
+        self.pwr_canvas.itemconfig(self._pwr_fill_id, state='normal')
 
     def update_cpu_data(self, data: Dict[str, float]):
         """Update CPU display"""
-        try:
-            # Update CPU percentage
-            cpu_percent = data.get('cpu_percent', 0.0)
-            self.cpu_value_label.config(text=f"{cpu_percent:.1f}%")
-            self.draw_cpu_bar(cpu_percent)
-
-            # Update CPU temperature
-            cpu_temp = data.get('cpu_temp', 0.0)
-            self.temp_value_label.config(text=f"{cpu_temp:.0f}°C")
+        if not self._alive:
+            return  # GUI destroyed
+
+        # Quantize once to display precision as ints; the caches, format
+        # helpers and bar drawers all work in the same integer units
+        cpu_tenths = int(round(data.get('cpu_percent', 0.0) * 10))
+        if cpu_tenths != self._last_cpu:
+            self._last_cpu = cpu_tenths
+            self.cpu_var.set(_pct1(cpu_tenths))
+            self.draw_cpu_bar(cpu_tenths)
+
+        # Update CPU temperature
+        cpu_temp = round(data.get('cpu_temp', 0.0))
+        if cpu_temp != self._last_temp:
+            self._last_temp = cpu_temp
+            self.temp_var.set(_degc(cpu_temp))
             self.draw_temp_bar(cpu_temp)
 
-            # Update module power
-            power_w = data.get('power_w', 0.0)
-            self.pwr_value_label.config(text=f"{power_w:.1f}W")
-            self.draw_power_bar(power_w)
-        except:
-            pass  # GUI might be destroyed
+        # Update module power
+        pwr_tenths = int(round(data.get('power_w', 0.0) * 10))
+        if pwr_tenths != self._last_pwr:
+            self._last_pwr = pwr_tenths
+            self.pwr_var.set(_watts1(pwr_tenths))
+            self.draw_power_bar(pwr_tenths)
 
     def get_widget(self):
         """Get the main widget"""
@@ -340,9 +418,16 @@ class CPUWidget:
 
 
 class StatusBar:
+    __slots__ = ('parent', 'broker_host', 'bar', 'connection_status',
+                 'time_label', 'time_var', '_next_tick', '_last_minute', '_alive')
+
     def __init__(self, parent, broker_host: str):
         self.parent = parent
         self.broker_host = broker_host
+        # The display only changes once a minute; between minute boundaries
+        # the 1 Hz ticks return on a single float compare
+        self._next_tick = 0.0
+        self._last_minute = ''
         self.setup_widget()
 
     def setup_widget(self):
@@ -354,10 +439,18 @@ class StatusBar:
         self.connection_status.pack(side='left', padx=15, pady=8)
 
         # Current time (right side of status bar)
-        self.time_label = tk.Label(self.bar, text="--:--", font=('Arial', 11, 'bold'),
+        self.time_var = tk.StringVar(value="--:--")
+        self.time_label = tk.Label(self.bar, textvariable=self.time_var, font=('Arial', 11, 'bold'),
                                  bg='#404040', fg='white')
         self.time_label.pack(side='right', padx=15, pady=8)
 
+        # Same teardown flag as the status cards -- see _on_destroy
+        self._alive = True
+        self.bar.bind('<Destroy>', self._on_destroy)
+
+    def _on_destroy(self, event):
+        self._alive = False
+
     def update_connection_status(self, connected: bool, message: str = None):
         """Update connection status"""
         if connected:
@@ -371,12 +464,18 @@ class StatusBar:
 
     def update_time(self):
         """Update time display — only redraws when the minute changes"""
-        try:
-            current_time = datetime.now().strftime("%H:%M")
-            if self.time_label.cget('text') != current_time:
-                self.time_label.config(text=current_time)
-        except:
-            pass  # GUI might be destroyed
+        if not self._alive:
+            return  # GUI destroyed
+        now = time.time()
+        if now < self._next_tick:
+            return
+        lt = time.localtime(now)
+        current_time = time.strftime("%H:%M", lt)
+        if current_time != self._last_minute:
+            self._last_minute = current_time
+            self.time_var.set(current_time)
+        # Sleep the fast path until just before the next minute boundary
+        self._next_tick = now + (60 - lt.tm_sec) - 0.05
 
     def get_widget(self):
         """Get the main widget"""
@@ -5,7 +5,8 @@ Bridges the CSI camera (OV5647 via picamera2) to the PC-client GUI using the
 request/response image protocol the GUI already speaks:
 
   GUI  -> rider/control/image_capture  {"request_id", "resolution"}   (high|low|tiny)
-  here -> rider/response/image_capture {"request_id","success","image_data"(b64 JPEG),...}
+  here -> rider/camera/frame           raw JPEG bytes (MQTT is binary-safe)
+          rider/response/image_capture {"request_id","success":false,"error",...} on failure
 
 ON-DEMAND: the camera (sensor + ISP) is started on the first request and stopped
 after a few idle seconds, so it draws no power when nobody is viewing the feed.
@@ -17,7 +18,6 @@ owner) so camera work can never stall the balance loop. Local broker only.
 
 Run:    /home/pi/xgovenv/bin/python rider_camera.py
 """
-import base64
 import json
 import threading
 import time
@@ -28,7 +28,8 @@ from picamera2 import Picamera2
 
 BROKER, PORT = "localhost", 1883
 TOPIC_REQ = "rider/control/image_capture"
-TOPIC_RESP = "rider/response/image_capture"
+TOPIC_RESP = "rider/response/image_capture"   # JSON, errors only
+TOPIC_FRAME = "rider/camera/frame"            # raw JPEG bytes
 
 RES = {"high": (640, 480), "low": (320, 240), "tiny": (160, 120)}
 JPEG_QUALITY = 70
@@ -63,7 +64,7 @@ def _stop():
 
 
 def capture_jpeg(resolution):
-    """Grab a frame (starting the camera if needed), scale, return (b64 jpeg, len)."""
+    """Grab a frame (starting the camera if needed), scale, return raw JPEG bytes."""
     global _last_req
     w, h = RES.get(resolution, RES["high"])
     with _lock:
@@ -75,8 +76,7 @@ def capture_jpeg(resolution):
     ok, jpg = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
     if not ok:
         raise RuntimeError("JPEG encode failed")
-    data = jpg.tobytes()
-    return base64.b64encode(data).decode("ascii"), len(data)
+    return jpg.tobytes()
 
 
 def _idle_watchdog():
@@ -101,15 +101,9 @@ def on_message(client, userdata, msg):
     req_id = p.get("request_id", "")
     resolution = p.get("resolution", "high")
     try:
-        b64, nbytes = capture_jpeg(resolution)
-        client.publish(TOPIC_RESP, json.dumps({
-            "request_id": req_id,
-            "success": True,
-            "image_data": b64,
-            "resolution": resolution,
-            "image_size": nbytes,
-            "timestamp": time.time(),
-        }))
+        # Raw bytes straight onto the wire: no base64 pass on either end and
+        # a third less payload than the old JSON envelope
+        client.publish(TOPIC_FRAME, capture_jpeg(resolution))
     except Exception as e:
         print("capture failed: %s" % e, flush=True)
         client.publish(TOPIC_RESP, json.dumps({
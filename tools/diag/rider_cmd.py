@@ -14,7 +14,7 @@ Convenience:
   python3 rider_cmd.py start         # = polrun 1 then en 1  (run the policy)
   python3 rider_cmd.py stop          # = en 0
 """
-import sys, json, time
+import sys, json
 import paho.mqtt.client as mqtt
 
 BROKER = "10.0.0.95"
@@ -22,9 +22,12 @@ TOPIC = "rider/control/line"
 
 
 def send(client, line):
-    client.publish(TOPIC, json.dumps({"line": line}), qos=1)
+    # qos=1: drive the network loop on this thread until the broker acks,
+    # instead of parking in a sleep while a loop_start() thread does the work.
+    info = client.publish(TOPIC, json.dumps({"line": line}), qos=1)
+    while not info.is_published():
+        client.loop(timeout=0.5)
     print("sent:", line)
-    time.sleep(0.25)
 
 
 def main():
@@ -32,14 +35,14 @@ def main():
     if not args:
         print(__doc__); return
     c = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, client_id="rider_cmd")
-    c.connect(BROKER, 1883); c.loop_start()
+    c.connect(BROKER, 1883)
     if args[0] == "start":
         send(c, "polrun 1"); send(c, "en 1")
     elif args[0] == "stop":
         send(c, "en 0")
     else:
         send(c, " ".join(args))
-    time.sleep(0.2); c.disconnect()
+    c.disconnect()
 
 
 if __name__ == "__main__":